@@ -1,13 +1,18 @@
-from app import SessionLocal
+import asyncio
+
+from db import SessionLocal
 from sqlalchemy import text
 
-db = SessionLocal()
-try:
-    # Create a test user
-    db.execute(text("INSERT INTO users (id, username) VALUES (999, 'TestPlayer') ON CONFLICT (id) DO NOTHING"))
-    db.commit()
-    print("User 999 created successfully.")
-except Exception as e:
-    print(f"Error creating user: {e}")
-finally:
-    db.close()
+
+async def main():
+    async with SessionLocal() as db:
+        try:
+            # Create a test user
+            await db.execute(text("INSERT INTO users (id, username) VALUES (999, 'TestPlayer') ON CONFLICT (id) DO NOTHING"))
+            await db.commit()
+            print("User 999 created successfully.")
+        except Exception as e:
+            print(f"Error creating user: {e}")
+
+
+asyncio.run(main())
@@ -1,9 +1,100 @@
 """
-Rate limiter configuration using SlowAPI.
+Rate limiter configuration.
+
+Every endpoint is limited per client IP by an atomic token bucket kept in
+Redis (db 1), so limits hold across all uvicorn workers. Buckets run on the
+async Redis client and never block the event loop.
+"""
+
+import logging
+
+from fastapi import HTTPException, Request
+
+logger = logging.getLogger(__name__)
+
+RATE_LIMIT_STORAGE_URI = "redis://localhost:6379/1"
+
+
+def _client_ip(request: Request) -> str:
+    """Rate-limit key: the client's IP address."""
+    return request.client.host if request.client else "127.0.0.1"
+
+
+# ── Token bucket ─────────────────────────────────────────────────
+
+# Refill, take one token and persist the bucket in a single atomic round-trip.
+# Uses the Redis server clock so every worker agrees on elapsed time.
+_TOKEN_BUCKET_LUA = """
+local capacity = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2])
+local t = redis.call('TIME')
+local now = tonumber(t[1]) + tonumber(t[2]) / 1000000
+
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(state[1]) or capacity
+local last = tonumber(state[2]) or now
+
+tokens = math.min(capacity, tokens + math.max(0, now - last) * rate)
+local allowed = 0
+if tokens >= 1 then
+    tokens = tokens - 1
+    allowed = 1
+end
+
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'ts', tostring(now))
+redis.call('EXPIRE', KEYS[1], math.ceil(capacity / rate) + 1)
+return allowed
 """
 
-from slowapi import Limiter
-from slowapi.util import get_remote_address
+_redis_client = None
+_token_bucket_script = None
+
+
+async def _get_script():
+    """Lazy-initialize the Redis client and register the bucket script."""
+    global _redis_client, _token_bucket_script
+    if _token_bucket_script is None:
+        import redis.asyncio as redis
+
+        _redis_client = redis.Redis.from_url(RATE_LIMIT_STORAGE_URI)
+        _token_bucket_script = _redis_client.register_script(_TOKEN_BUCKET_LUA)
+    return _token_bucket_script
+
+
+async def init_token_buckets():
+    """Connect to Redis and load the bucket script before serving traffic."""
+    try:
+        await _get_script()
+        await _redis_client.script_load(_TOKEN_BUCKET_LUA)
+    except Exception as exc:
+        logger.warning("⚠ Token bucket Redis unavailable: %s", exc)
+
+
+class TokenBucket:
+    """FastAPI dependency allowing `capacity` requests per `period` seconds per client IP."""
+
+    def __init__(self, name: str, capacity: int, period: int):
+        self.prefix = f"bucket:{name}:"
+        self.capacity = capacity
+        self.rate = capacity / period
+
+    async def __call__(self, request: Request):
+        try:
+            script = await _get_script()
+            allowed = await script(
+                keys=[self.prefix + _client_ip(request)],
+                args=[self.capacity, self.rate],
+            )
+        except Exception as exc:
+            # Fail open: a Redis outage must not take the API down
+            logger.warning("⚠ Token bucket unavailable — request not limited: %s", exc)
+            return
+        if not allowed:
+            raise HTTPException(status_code=429, detail="Rate limit exceeded")
+
 
-# Create a limiter instance that uses the client's IP address
-limiter = Limiter(key_func=get_remote_address)
+# 5 submissions / 60 reads per minute per client, bursting up to the capacity
+submit_rate_limit = TokenBucket("submit", capacity=5, period=60)
+submit_bulk_rate_limit = TokenBucket("submit_bulk", capacity=5, period=60)
+top_rate_limit = TokenBucket("top", capacity=60, period=60)
+rank_rate_limit = TokenBucket("rank", capacity=60, period=60)
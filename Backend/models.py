@@ -1,6 +1,9 @@
 """
 SQLAlchemy ORM models for the Gaming Leaderboard system.
 Tables: users, game_sessions, leaderboard
+
+Also defines the secondary performance indexes, shared by app startup
+and the bulk seeder (which drops them during load).
 """
 
 from sqlalchemy import (
@@ -47,13 +50,22 @@ class GameSession(Base):
 
 
 class Leaderboard(Base):
-    """Aggregated leaderboard entry per user with total score and rank."""
+    """
+    Aggregated leaderboard entry per user with total score and rank.
+
+    Hash-partitioned on user_id (LEADERBOARD_PARTITIONS ways) so concurrent
+    upserts spread their locks and index maintenance across partitions.
+    """
 
     __tablename__ = "leaderboard"
+    __table_args__ = {"postgresql_partition_by": "HASH (user_id)"}
 
-    id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    # The partition key must be part of the primary key
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
     total_score = Column(Integer, nullable=False)
+    # Denormalized from users (usernames never change) so reads skip the join
+    username = Column(String(255), nullable=True)
+    # Snapshot written by the seeder only; live ranks come from the Redis ZSET
     rank = Column(Integer, nullable=True)
 
     # Relationships
@@ -61,3 +73,25 @@ class Leaderboard(Base):
 
     def __repr__(self):
         return f"<Leaderboard(user_id={self.user_id}, total_score={self.total_score}, rank={self.rank})>"
+
+
+LEADERBOARD_PARTITIONS = 8
+
+
+# ── Performance Indexes ──────────────────────────────────────────
+
+INDEXES = {
+    "idx_gs_user_id":     "CREATE INDEX IF NOT EXISTS idx_gs_user_id       ON game_sessions (user_id)",
+    # Covering index: the top-N scan is index-only (no heap fetches)
+    # Partitioned index: each partition gets its own copy, /top merges them
+    "idx_lb_top_cover":   "CREATE INDEX IF NOT EXISTS idx_lb_top_cover      ON leaderboard  (total_score DESC) INCLUDE (user_id, username)",
+}
+
+# Indexes that only cost write overhead now; dropped if still present
+OBSOLETE_INDEXES = [
+    "idx_lb_rank",         # rank is no longer maintained per submit
+    "idx_lb_total_score",  # superseded by the covering idx_lb_top_cover
+    "idx_lb_topn",         # superseded by idx_lb_top_cover (adds username)
+    "idx_lb_user_id",      # user_id is the primary key
+    "idx_lb_user_unique",  # user_id is the primary key
+]
@@ -2,23 +2,30 @@
 Leaderboard API routes with caching, indexing, and atomic transactions.
 
 Endpoints:
-  POST /api/leaderboard/submit    — Submit a game score
-  GET  /api/leaderboard/top       — Get top 10 players
-  GET  /api/leaderboard/rank/{id} — Get a player's rank
+  POST /api/leaderboard/submit      — Submit a game score
+  POST /api/leaderboard/submit_bulk — Submit a batch of game scores
+  GET  /api/leaderboard/top         — Get top 10 players
+  GET  /api/leaderboard/rank/{id}   — Get a player's rank
 """
 
-import json
+import asyncio
 import logging
+from collections import defaultdict
 from datetime import datetime, timezone
 
-from fastapi import APIRouter, Depends, HTTPException, Request
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Response
 from sqlalchemy import text
-from sqlalchemy.orm import Session
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from limiter import limiter
+from db import SessionLocal, get_db
+from limiter import rank_rate_limit, submit_bulk_rate_limit, submit_rate_limit, top_rate_limit
 from schemas import (
     ScoreSubmission,
+    ScoreSubmissionBatch,
     SubmitResponse,
+    BulkSubmitResponse,
     LeaderboardResponse,
     LeaderboardEntry,
     PlayerRankResponse,
@@ -28,21 +35,107 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/leaderboard", tags=["Leaderboard"])
 
+# ── SQL statements ───────────────────────────────────────────────
+#
+# Built once at import: SQLAlchemy's compiled cache and psycopg's server-side
+# prepared statements are then hit on every call without rebuilding text().
+
+_STMT_LOAD_TOTALS = text("SELECT user_id, total_score FROM leaderboard")
+
+_STMT_GET_USERNAMES = text("SELECT user_id, username FROM leaderboard WHERE user_id = ANY(:uids)")
+
+_STMT_SUBMIT_SCORE = text(
+    """
+    WITH ins AS (
+        INSERT INTO game_sessions (user_id, score, game_mode)
+        VALUES (:uid, :score, :mode)
+        RETURNING user_id
+    )
+    INSERT INTO leaderboard (user_id, total_score, username)
+    SELECT ins.user_id, :score, u.username
+    FROM ins
+    JOIN users u ON u.id = ins.user_id
+    ON CONFLICT (user_id)
+    DO UPDATE SET total_score = leaderboard.total_score + EXCLUDED.total_score
+    RETURNING total_score
+    """
+)
+
+# One statement for the whole batch: three arrays, one round-trip
+_STMT_INS_SESSIONS_BULK = text(
+    """
+    INSERT INTO game_sessions (user_id, score, game_mode)
+    SELECT * FROM unnest(CAST(:uids AS int[]), CAST(:scores AS int[]), CAST(:modes AS varchar[]))
+    """
+)
+
+_STMT_UPSERT_LB_BULK = text(
+    """
+    INSERT INTO leaderboard (user_id, total_score, username)
+    SELECT t.uid, t.score, u.username
+    FROM unnest(CAST(:uids AS int[]), CAST(:scores AS int[])) AS t(uid, score)
+    JOIN users u ON u.id = t.uid
+    ON CONFLICT (user_id)
+    DO UPDATE SET total_score = leaderboard.total_score + EXCLUDED.total_score
+    RETURNING user_id, total_score
+    """
+)
+
+_STMT_TOP10 = text(
+    """
+    SELECT user_id, username, total_score
+    FROM leaderboard
+    ORDER BY total_score DESC
+    LIMIT 10
+    """
+)
+
+# Max age of the leaderboard_ranks snapshot /rank will use (see app.py)
+RANKS_REFRESH_INTERVAL = 30
+
+_STMT_PLAYER_RANK = text(
+    f"""
+    SELECT
+        l.user_id,
+        l.username,
+        l.total_score,
+        -- Snapshot rank if the snapshot is at most RANKS_REFRESH_INTERVAL
+        -- seconds old, so it can lag the live total_score by that much at
+        -- most; otherwise (or for players newer than the snapshot) the
+        -- exact live count.
+        COALESCE(
+            r.rank,
+            (SELECT COUNT(*) + 1 FROM leaderboard WHERE total_score > l.total_score)
+        ) AS computed_rank
+    FROM leaderboard l
+    LEFT JOIN leaderboard_ranks r
+        ON r.user_id = l.user_id
+        AND (SELECT max(refreshed_at) FROM leaderboard_ranks_refreshed)
+            > now() - interval '{RANKS_REFRESH_INTERVAL} seconds'
+    WHERE l.user_id = :uid
+    """
+)
+
 # ── Redis helper (graceful fallback if unavailable) ──────────────
 
+_redis_pool = None
 _redis_client = None
 
 
-def get_redis():
-    """Lazy-initialize and return the Redis client, or None if unavailable."""
-    global _redis_client
+async def get_redis():
+    """Lazy-initialize and return the async Redis client, or None if unavailable."""
+    global _redis_pool, _redis_client
     if _redis_client is not None:
         return _redis_client
     try:
-        import redis
-
-        _redis_client = redis.Redis(host="localhost", port=6379, db=0, decode_responses=True)
-        _redis_client.ping()
+        import redis.asyncio as redis
+
+        if _redis_pool is None:
+            # Raw bytes: cached JSON bodies go straight to the client without decoding
+            _redis_pool = redis.ConnectionPool(host="localhost", port=6379, db=0)
+        client = redis.Redis(connection_pool=_redis_pool)
+        await client.ping()
+        _redis_client = client
         logger.info("✓ Redis connected — caching is enabled")
         return _redis_client
     except Exception:
@@ -51,134 +144,282 @@ def get_redis():
         return None
 
 
-def cache_get(key: str):
-    """Read a JSON value from Redis; returns None on miss or if Redis is down."""
-    r = get_redis()
+async def close_redis():
+    """Release the Redis connection pool (called on shutdown)."""
+    global _redis_pool, _redis_client
+    if _redis_pool is not None:
+        await _redis_pool.disconnect()
+    _redis_pool = None
+    _redis_client = None
+
+
+# Cached bodies carry a hard TTL, pushed forward on every read, and a soft
+# TTL tracked by a companion "<key>:fresh" marker. Once the marker lapses the
+# stale body is still served while exactly one reader refreshes it in the
+# background, so a hot key never expires into a stampede on Postgres.
+CACHE_TTL = 5
+CACHE_SOFT_TTL = 3
+
+_background_tasks = set()
+
+
+def _spawn(coro):
+    """Run a fire-and-forget task, keeping a reference until it finishes."""
+    task = asyncio.create_task(coro)
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+
+
+async def cache_get(key: str, refresh=None):
+    """
+    Read a serialized JSON body from Redis; returns None on miss or if Redis is down.
+
+    `refresh` is a zero-argument callable returning a coroutine that rebuilds
+    the entry; it is scheduled when the body is past its soft TTL.
+    """
+    r = await get_redis()
     if r is None:
         return None
     try:
-        data = r.get(key)
-        return json.loads(data) if data else None
+        async with r.pipeline(transaction=False) as pipe:
+            pipe.getex(key, ex=CACHE_TTL)
+            # Succeeds for one reader only once the soft TTL has lapsed
+            pipe.set(f"{key}:fresh", 1, nx=True, ex=CACHE_SOFT_TTL)
+            body, stale = await pipe.execute()
     except Exception:
         return None
+    if body is not None and stale and refresh is not None:
+        _spawn(refresh())
+    return body
 
 
-def cache_set(key: str, value, ttl: int = 5):
-    """Write a JSON value to Redis with a TTL (seconds)."""
-    r = get_redis()
+async def cache_set(key: str, body: bytes, ttl: int = CACHE_TTL):
+    """Write a serialized JSON body to Redis with a TTL (seconds) and restart its soft TTL."""
+    r = await get_redis()
     if r is None:
         return
     try:
-        r.setex(key, ttl, json.dumps(value, default=str))
+        async with r.pipeline(transaction=False) as pipe:
+            pipe.set(key, body, ex=ttl)
+            pipe.set(f"{key}:fresh", 1, ex=CACHE_SOFT_TTL)
+            await pipe.execute()
     except Exception:
         pass
 
 
-def cache_invalidate(*keys: str):
+async def cache_invalidate(*keys: str):
     """Delete one or more cache keys."""
-    r = get_redis()
+    r = await get_redis()
     if r is None:
         return
     try:
-        r.delete(*keys)
+        await r.delete(*keys)
     except Exception:
         pass
 
 
-# ── Dependency ───────────────────────────────────────────────────
+# ── Redis sorted-set leaderboard ─────────────────────────────────
+#
+# Postgres stays the source of truth; Redis mirrors every player's total in a
+# ZSET so /top and /rank are answered in O(log N) without touching the DB.
+# The "ready" marker is only set once the ZSET has been fully loaded — until
+# then (or whenever Redis is down) reads fall back to Postgres.
+#
+# Submits mirror into Redis after the Postgres commit, so a Redis error (or a
+# worker dying in between) can leave a member behind its real total. Every
+# LEADERBOARD_ZSET_RESYNC_INTERVAL seconds one worker re-streams the table
+# with ZADD GT; totals only grow, so that converges the ZSET on Postgres.
+# Workers' timers drift apart, so the load lock is left to expire after a
+# successful load rather than released: later timers in the same interval
+# find it taken and skip their resync. The
+# ready marker expires unless resyncs keep renewing it, so a mirror nobody
+# reconciles any more stops being served.
+
+LEADERBOARD_ZSET = "leaderboard"
+LEADERBOARD_ZSET_READY = "leaderboard:ready"
+LEADERBOARD_ZSET_LOCK = "leaderboard:warming"
+LEADERBOARD_ZSET_RESYNC_INTERVAL = 300
+LEADERBOARD_ZSET_READY_TTL = 3 * LEADERBOARD_ZSET_RESYNC_INTERVAL
+
+
+def _username_key(user_id: int) -> str:
+    return f"user:{user_id}:name"
+
+
+async def warm_leaderboard_zset(resync: bool = False):
+    """
+    Load every leaderboard total into the Redis ZSET.
+
+    On startup this is a no-op if the ZSET is already ready; with `resync`
+    it reconciles a ready ZSET against Postgres and renews the ready marker.
+    """
+    r = await get_redis()
+    if r is None:
+        return
+    try:
+        if not resync and await r.exists(LEADERBOARD_ZSET_READY):
+            return
+        # Only one worker loads per interval; the others keep serving meanwhile
+        if not await r.set(LEADERBOARD_ZSET_LOCK, 1, nx=True, ex=LEADERBOARD_ZSET_RESYNC_INTERVAL):
+            return
+
+        loaded = 0
+        try:
+            async with SessionLocal() as db:
+                result = await db.stream(_STMT_LOAD_TOTALS)
+                async for chunk in result.partitions(10_000):
+                    # GT: never overwrite a newer total written by a concurrent submit
+                    await r.zadd(LEADERBOARD_ZSET, {str(uid): total for uid, total in chunk}, gt=True)
+                    loaded += len(chunk)
+            await r.set(LEADERBOARD_ZSET_READY, 1, ex=LEADERBOARD_ZSET_READY_TTL)
+        except Exception:
+            # Free the lock so the next worker to wake retries
+            await r.delete(LEADERBOARD_ZSET_LOCK)
+            raise
+        logger.info("✓ Leaderboard ZSET %s (%d players)", "resynced" if resync else "loaded", loaded)
+    except Exception as exc:
+        logger.warning("⚠ Leaderboard ZSET load failed — serving from Postgres: %s", exc)
+
+
+async def resync_leaderboard_zset_periodically():
+    """Background loop reconciling the ZSET with Postgres."""
+    while True:
+        await asyncio.sleep(LEADERBOARD_ZSET_RESYNC_INTERVAL)
+        await warm_leaderboard_zset(resync=True)
 
-def get_db():
-    """Import the session factory from app.py and yield a session."""
-    from app import SessionLocal
 
-    db = SessionLocal()
+async def leaderboard_zset_ready() -> bool:
+    """Whether /top and /rank can currently be served from the ZSET."""
+    r = await get_redis()
+    if r is None:
+        return False
     try:
-        yield db
-    finally:
-        db.close()
+        return bool(await r.exists(LEADERBOARD_ZSET_READY))
+    except Exception:
+        return False
+
+
+async def _usernames(r, db: AsyncSession, user_ids: list[int]) -> dict[int, str]:
+    """Resolve usernames via the Redis cache, filling misses from Postgres."""
+    cached = await r.mget([_username_key(uid) for uid in user_ids])
+    names = {uid: name.decode() for uid, name in zip(user_ids, cached) if name is not None}
+
+    missing = [uid for uid in user_ids if uid not in names]
+    if missing:
+        result = await db.execute(
+            _STMT_GET_USERNAMES,
+            {"uids": missing},
+        )
+        fetched = {uid: name for uid, name in result.fetchall() if name is not None}
+        if fetched:
+            # Usernames never change, so these keys need no TTL
+            await r.mset({_username_key(uid): name for uid, name in fetched.items()})
+        names.update(fetched)
+    return names
+
+
+async def _top_from_zset(db: AsyncSession):
+    """Top 10 entries from the ZSET, or None if it can't be used."""
+    r = await get_redis()
+    if r is None:
+        return None
+    try:
+        async with r.pipeline(transaction=False) as pipe:
+            pipe.exists(LEADERBOARD_ZSET_READY)
+            pipe.zrevrange(LEADERBOARD_ZSET, 0, 9, withscores=True)
+            ready, members = await pipe.execute()
+        if not ready:
+            return None
+
+        user_ids = [int(member) for member, _ in members]
+        names = await _usernames(r, db, user_ids)
+        return [
+            LeaderboardEntry(rank=idx + 1, user_id=uid, username=names[uid], total_score=int(score))
+            for idx, (uid, (_, score)) in enumerate(zip(user_ids, members))
+            if uid in names
+        ]
+    except Exception:
+        return None
+
+
+async def _rank_from_zset(db: AsyncSession, user_id: int):
+    """A player's rank from the ZSET, or None if it can't be used."""
+    r = await get_redis()
+    if r is None:
+        return None
+    try:
+        async with r.pipeline(transaction=False) as pipe:
+            pipe.exists(LEADERBOARD_ZSET_READY)
+            pipe.zscore(LEADERBOARD_ZSET, user_id)
+            ready, score = await pipe.execute()
+        if not ready or score is None:
+            return None
+
+        total = int(score)
+        # Competition rank (1224): players strictly above this total, plus one
+        above = await r.zcount(LEADERBOARD_ZSET, f"({total}", "+inf")
+        names = await _usernames(r, db, [user_id])
+        if user_id not in names:
+            return None
+        return PlayerRankResponse(
+            user_id=user_id,
+            username=names[user_id],
+            total_score=total,
+            rank=above + 1,
+        )
+    except Exception:
+        return None
 
 
 # ── 1. Submit Score ──────────────────────────────────────────────
 
-@router.post("/submit", response_model=SubmitResponse)
-@limiter.limit("5/minute")
-def submit_score(request: Request, payload: ScoreSubmission, db: Session = Depends(get_db)):
+@router.post("/submit", response_model=SubmitResponse, dependencies=[Depends(submit_rate_limit)])
+async def submit_score(payload: ScoreSubmission, db: AsyncSession = Depends(get_db)):
     """
     Submit a game score for a player.
 
-    Steps (inside a single transaction):
-      1. Verify user exists
-      2. Insert a new game_session row
-      3. Upsert the leaderboard entry (sum scores, recalculate rank)
+    Runs as a single statement (one round-trip, one transaction):
+      1. Insert a new game_session row — the users FK rejects unknown players
+      2. Upsert the leaderboard entry (sum scores)
+      3. Return the new total
+
+    The rank is read back from the Redis ZSET rather than stored on the row,
+    so no per-submit COUNT(*) scan is needed; it is null while the ZSET
+    isn't ready.
     """
     try:
         # --- Begin atomic transaction --------------------------------
-        # 1. Validate user
-        user = db.execute(
-            text("SELECT id, username FROM users WHERE id = :uid"),
-            {"uid": payload.user_id},
-        ).fetchone()
-
-        if not user:
-            raise HTTPException(status_code=404, detail=f"User {payload.user_id} not found")
-
-        # 2. Insert game session
-        db.execute(
-            text(
-                "INSERT INTO game_sessions (user_id, score, game_mode) "
-                "VALUES (:uid, :score, :mode)"
-            ),
+        result = await db.execute(
+            _STMT_SUBMIT_SCORE,
             {"uid": payload.user_id, "score": payload.score, "mode": payload.game_mode},
         )
+        row = result.fetchone()
 
-        # 3. Upsert leaderboard entry (atomic)
-        db.execute(
-            text(
-                """
-                INSERT INTO leaderboard (user_id, total_score, rank)
-                VALUES (:uid, :score, 0)
-                ON CONFLICT (user_id)
-                DO UPDATE SET total_score = leaderboard.total_score + :score
-                """
-            ),
-            {"uid": payload.user_id, "score": payload.score},
-        )
-
-        # 4. Fetch updated total
-        row = db.execute(
-            text("SELECT total_score FROM leaderboard WHERE user_id = :uid"),
-            {"uid": payload.user_id},
-        ).fetchone()
-
-        new_total = row[0] if row else payload.score
-
-        # 5. Recalculate rank for this user only (lightweight)
-        rank_row = db.execute(
-            text(
-                """
-                SELECT COUNT(*) + 1
-                FROM leaderboard
-                WHERE total_score > :total
-                """
-            ),
-            {"total": new_total},
-        ).fetchone()
-
-        new_rank = rank_row[0] if rank_row else 1
-
-        # Update rank
-        db.execute(
-            text("UPDATE leaderboard SET rank = :rank WHERE user_id = :uid"),
-            {"rank": new_rank, "uid": payload.user_id},
-        )
-
-        db.commit()
+        await db.commit()
         # --- End atomic transaction ----------------------------------
 
-        # Invalidate caches so next reads reflect the new data
-        cache_invalidate("leaderboard:top10", f"rank:{payload.user_id}")
-
-        logger.info("Score %d submitted for user %d (total=%d, rank=%d)",
+        new_total = row[0]
+        new_rank = None
+
+        # Mirror the new total, invalidate caches and read the rank (one round-trip)
+        r = await get_redis()
+        if r is not None:
+            try:
+                async with r.pipeline(transaction=False) as pipe:
+                    pipe.zadd(LEADERBOARD_ZSET, {str(payload.user_id): new_total}, gt=True)
+                    pipe.delete("leaderboard:top10", f"rank:{payload.user_id}")
+                    pipe.exists(LEADERBOARD_ZSET_READY)
+                    pipe.zcount(LEADERBOARD_ZSET, f"({new_total}", "+inf")
+                    _, _, ready, above = await pipe.execute()
+                # A ZSET that isn't fully loaded only holds recent submitters
+                if ready:
+                    new_rank = above + 1
+            except Exception as exc:
+                # Postgres is committed; the next ZSET resync repairs the mirror
+                logger.warning("⚠ Leaderboard mirror update failed for user %d: %s",
+                               payload.user_id, exc)
+
+        logger.info("Score %d submitted for user %d (total=%d, rank=%s)",
                      payload.score, payload.user_id, new_total, new_rank)
 
         return SubmitResponse(
@@ -188,94 +429,170 @@ def submit_score(request: Request, payload: ScoreSubmission, db: Session = Depen
             new_rank=new_rank,
         )
 
-    except HTTPException:
-        raise
+    except IntegrityError:
+        # game_sessions.user_id → users.id foreign key violation
+        await db.rollback()
+        raise HTTPException(status_code=404, detail=f"User {payload.user_id} not found")
     except Exception as exc:
-        db.rollback()
+        await db.rollback()
         logger.error("submit_score failed: %s", exc)
         raise HTTPException(status_code=500, detail="Internal server error")
 
 
-# ── 2. Get Leaderboard (Top 10) ─────────────────────────────────
+# ── 1b. Submit Scores (Bulk) ─────────────────────────────────────
 
-@router.get("/top", response_model=LeaderboardResponse)
-@limiter.limit("60/minute")
-def get_leaderboard(request: Request, db: Session = Depends(get_db)):
-    """Return the top 10 players, sorted by total_score descending."""
+@router.post("/submit_bulk", response_model=BulkSubmitResponse, dependencies=[Depends(submit_bulk_rate_limit)])
+async def submit_score_bulk(payload: ScoreSubmissionBatch, db: AsyncSession = Depends(get_db)):
+    """
+    Submit a batch of game scores in a single transaction.
 
-    # Try cache first
-    cached = cache_get("leaderboard:top10")
-    if cached:
-        return LeaderboardResponse(**cached)
-
-    rows = db.execute(
-        text(
-            """
-            SELECT l.rank, l.user_id, u.username, l.total_score
-            FROM leaderboard l
-            JOIN users u ON u.id = l.user_id
-            ORDER BY l.total_score DESC
-            LIMIT 10
-            """
+    Steps:
+      1. Insert every game_session row in one unnest() statement
+      2. Upsert one leaderboard entry per user with the summed batch score
+    """
+    sessions = {
+        "uids": [s.user_id for s in payload.scores],
+        "scores": [s.score for s in payload.scores],
+        "modes": [s.game_mode for s in payload.scores],
+    }
+
+    # ON CONFLICT cannot touch the same row twice in one statement,
+    # so collapse the batch to one total per user first.
+    totals: dict[int, int] = defaultdict(int)
+    for s in payload.scores:
+        totals[s.user_id] += s.score
+
+    try:
+        # --- Begin atomic transaction --------------------------------
+        await db.execute(_STMT_INS_SESSIONS_BULK, sessions)
+
+        result = await db.execute(
+            _STMT_UPSERT_LB_BULK,
+            # Sorted so concurrent batches lock leaderboard rows in the same order
+            {"uids": sorted(totals), "scores": [totals[uid] for uid in sorted(totals)]},
         )
-    ).fetchall()
+        new_totals = result.fetchall()
+
+        await db.commit()
+        # --- End atomic transaction ----------------------------------
+
+        # Mirror the new totals and invalidate caches (one round-trip)
+        r = await get_redis()
+        if r is not None:
+            try:
+                async with r.pipeline(transaction=False) as pipe:
+                    pipe.zadd(LEADERBOARD_ZSET, {str(uid): total for uid, total in new_totals}, gt=True)
+                    pipe.delete("leaderboard:top10", *(f"rank:{uid}" for uid in totals))
+                    await pipe.execute()
+            except Exception as exc:
+                # Postgres is committed; the next ZSET resync repairs the mirror
+                logger.warning("⚠ Leaderboard mirror update failed for %d users: %s",
+                               len(totals), exc)
+
+        logger.info("Bulk submitted %d scores for %d users", len(payload.scores), len(totals))
+
+        return BulkSubmitResponse(
+            message="Scores submitted successfully",
+            accepted=len(payload.scores),
+            users_updated=len(totals),
+        )
+
+    except IntegrityError:
+        await db.rollback()
+        raise HTTPException(status_code=404, detail="One or more users not found")
+    except Exception as exc:
+        await db.rollback()
+        logger.error("submit_score_bulk failed: %s", exc)
+        raise HTTPException(status_code=500, detail="Internal server error")
 
-    entries = [
-        LeaderboardEntry(rank=idx + 1, user_id=r[1], username=r[2], total_score=r[3])
-        for idx, r in enumerate(rows)
-    ]
+
+# ── 2. Get Leaderboard (Top 10) ─────────────────────────────────
+
+async def _build_top10(db: AsyncSession) -> bytes:
+    """Build, cache and return the serialized top-10 response."""
+    entries = await _top_from_zset(db)
+    if entries is None:
+        result = await db.execute(_STMT_TOP10)
+        rows = result.fetchall()
+
+        entries = [
+            LeaderboardEntry(rank=idx + 1, user_id=r[0], username=r[1], total_score=r[2])
+            for idx, r in enumerate(rows)
+        ]
 
     response = LeaderboardResponse(
         leaderboard=entries,
         updated_at=datetime.now(timezone.utc),
     )
 
-    # Cache for 5 seconds
-    cache_set("leaderboard:top10", response.model_dump())
+    # Serialize once for both the cache and the client
+    body = orjson.dumps(response.model_dump())
+    await cache_set("leaderboard:top10", body)
+    return body
 
-    return response
+
+@router.get("/top", response_model=LeaderboardResponse, dependencies=[Depends(top_rate_limit)])
+async def get_leaderboard(db: AsyncSession = Depends(get_db)):
+    """Return the top 10 players, sorted by total_score descending."""
+
+    # Try cache first — the stored body is returned as-is, skipping Pydantic
+    cached = await cache_get("leaderboard:top10", refresh=lambda: _refresh(_build_top10))
+    if cached:
+        return Response(content=cached, media_type="application/json")
+
+    body = await _build_top10(db)
+    return Response(content=body, media_type="application/json")
 
 
 # ── 3. Get Player Rank ──────────────────────────────────────────
 
-@router.get("/rank/{user_id}", response_model=PlayerRankResponse)
-@limiter.limit("60/minute")
-def get_player_rank(request: Request, user_id: int, db: Session = Depends(get_db)):
+async def _build_player_rank(db: AsyncSession, user_id: int):
+    """Build, cache and return a player's serialized rank, or None if unranked."""
+    response = await _rank_from_zset(db, user_id)
+    if response is None:
+        result = await db.execute(
+            _STMT_PLAYER_RANK,
+            {"uid": user_id},
+        )
+        row = result.fetchone()
+
+        if not row:
+            return None
+
+        response = PlayerRankResponse(
+            user_id=row[0],
+            username=row[1],
+            total_score=row[2],
+            rank=row[3],
+        )
+
+    # Serialize once for both the cache and the client
+    body = orjson.dumps(response.model_dump())
+    await cache_set(f"rank:{user_id}", body)
+    return body
+
+
+@router.get("/rank/{user_id}", response_model=PlayerRankResponse, dependencies=[Depends(rank_rate_limit)])
+async def get_player_rank(user_id: int, db: AsyncSession = Depends(get_db)):
     """Fetch a specific player's rank and total score."""
 
-    # Try cache first
-    cache_key = f"rank:{user_id}"
-    cached = cache_get(cache_key)
+    # Try cache first — the stored body is returned as-is, skipping Pydantic
+    cached = await cache_get(f"rank:{user_id}", refresh=lambda: _refresh(_build_player_rank, user_id))
     if cached:
-        return PlayerRankResponse(**cached)
-
-    row = db.execute(
-        text(
-            """
-            SELECT
-                l.user_id,
-                u.username,
-                l.total_score,
-                (SELECT COUNT(*) + 1 FROM leaderboard WHERE total_score > l.total_score) AS computed_rank
-            FROM leaderboard l
-            JOIN users u ON u.id = l.user_id
-            WHERE l.user_id = :uid
-            """
-        ),
-        {"uid": user_id},
-    ).fetchone()
-
-    if not row:
+        return Response(content=cached, media_type="application/json")
+
+    body = await _build_player_rank(db, user_id)
+    if body is None:
         raise HTTPException(status_code=404, detail=f"No leaderboard entry for user {user_id}")
+    return Response(content=body, media_type="application/json")
 
-    response = PlayerRankResponse(
-        user_id=row[0],
-        username=row[1],
-        total_score=row[2],
-        rank=row[3],
-    )
 
-    # Cache for 5 seconds
-    cache_set(cache_key, response.model_dump())
+# ── Background refresh ──────────────────────────────────────────
 
-    return response
+async def _refresh(build, *args):
+    """Rebuild a stale cache entry on its own session, outside any request."""
+    try:
+        async with SessionLocal() as db:
+            await build(db, *args)
+    except Exception as exc:
+        logger.warning("⚠ Cache refresh failed: %s", exc)
@@ -17,6 +17,12 @@ class ScoreSubmission(BaseModel):
     game_mode: str = Field(default="solo", description="Game mode: 'solo' or 'team'")
 
 
+class ScoreSubmissionBatch(BaseModel):
+    """Request body for submitting many scores in one call."""
+
+    scores: list[ScoreSubmission] = Field(..., min_length=1, max_length=1000)
+
+
 # ── Response Schemas ─────────────────────────────────────────────
 
 class SubmitResponse(BaseModel):
@@ -28,6 +34,14 @@ class SubmitResponse(BaseModel):
     new_rank: Optional[int] = None
 
 
+class BulkSubmitResponse(BaseModel):
+    """Response after successfully submitting a batch of scores."""
+
+    message: str
+    accepted: int
+    users_updated: int
+
+
 class LeaderboardEntry(BaseModel):
     """A single entry in the leaderboard response."""
 
@@ -4,23 +4,35 @@ Load simulation script for the Gaming Leaderboard API.
 Continuously submits scores, fetches the leaderboard, and queries
 random player ranks to simulate real user behaviour under load.
 
+Each cycle fans a batch of users out over a thread pool sharing one
+keep-alive HTTP session, so the run measures the API rather than TCP setup.
+
 Usage:
     python simulate_load.py
 """
 
 import random
 import time
+from concurrent.futures import ThreadPoolExecutor
 
 import requests
+from requests.adapters import HTTPAdapter
 
 API_BASE_URL = "http://localhost:8000/api/leaderboard"
 
+WORKERS = 8
+USERS_PER_CYCLE = 50
+
+session = requests.Session()
+adapter = HTTPAdapter(pool_connections=32, pool_maxsize=64)
+session.mount("http://", adapter)
+
 
 def submit_score(user_id: int):
     """POST a random score for the given user."""
     score = random.randint(100, 10000)
     try:
-        resp = requests.post(
+        resp = session.post(
             f"{API_BASE_URL}/submit",
             json={"user_id": user_id, "score": score, "game_mode": random.choice(["solo", "team"])},
             timeout=10,
@@ -33,7 +45,7 @@ def submit_score(user_id: int):
 def get_top_players():
     """GET the top-10 leaderboard."""
     try:
-        resp = requests.get(f"{API_BASE_URL}/top", timeout=10)
+        resp = session.get(f"{API_BASE_URL}/top", timeout=10)
         data = resp.json()
         print(f"  ↓ top-10  entries={len(data.get('leaderboard', []))}")
         return data
@@ -45,7 +57,7 @@ def get_top_players():
 def get_user_rank(user_id: int):
     """GET the rank of a specific user."""
     try:
-        resp = requests.get(f"{API_BASE_URL}/rank/{user_id}", timeout=10)
+        resp = session.get(f"{API_BASE_URL}/rank/{user_id}", timeout=10)
         data = resp.json()
         print(f"  ↓ rank    user={user_id}  rank={data.get('rank', '?')}")
         return data
@@ -54,18 +66,24 @@ def get_user_rank(user_id: int):
         return {}
 
 
+def simulate_user(user_id: int):
+    """Run one player's submit → top-10 → rank sequence."""
+    submit_score(user_id)
+    get_top_players()
+    get_user_rank(user_id)
+
+
 if __name__ == "__main__":
     print("🚀 Load simulation started — press Ctrl+C to stop\n")
     cycle = 0
     try:
-        while True:
-            cycle += 1
-            user_id = random.randint(1, 1_000_000)
-            print(f"── Cycle {cycle} ──")
-            submit_score(user_id)
-            get_top_players()
-            get_user_rank(user_id)
-            delay = random.uniform(0.5, 2)
-            time.sleep(delay)
+        with ThreadPoolExecutor(max_workers=WORKERS) as pool:
+            while True:
+                cycle += 1
+                user_ids = [random.randint(1, 1_000_000) for _ in range(USERS_PER_CYCLE)]
+                print(f"── Cycle {cycle} ({len(user_ids)} users) ──")
+                list(pool.map(simulate_user, user_ids))
+                delay = random.uniform(0.5, 2)
+                time.sleep(delay)
     except KeyboardInterrupt:
         print("\n⏹ Simulation stopped")
@@ -49,7 +49,9 @@ export default function SubmitScore() {
                 throw new Error(data.detail || `HTTP ${res.status}`)
             }
 
-            setMessage(`Success! User ${data.user_id} is now Rank #${data.new_rank} (Total: ${data.new_total_score})`)
+            // new_rank is null while the server's leaderboard mirror is unavailable
+            const rankText = data.new_rank != null ? `is now Rank #${data.new_rank}` : 'scored'
+            setMessage(`Success! User ${data.user_id} ${rankText} (Total: ${data.new_total_score})`)
             setScore('') // Clear score to prevent double submit
         } catch (err) {
             setError(err.message)